@@ -1,16 +1,106 @@
 import os
+import functools
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+from pandas.api.types import union_categoricals
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+# Non-interactive backend: figures are only written to files, also from worker processes.
+# Matplotlib and seaborn themselves are imported inside the plotting functions, so loading
+# and cleaning data does not pay for them.
+os.environ.setdefault('MPLBACKEND', 'Agg')
 from scipy import stats
 from datetime import datetime
 import logging
 import re
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+except ImportError:  # Optional: enables the Arrow CSV reader and the Parquet cache
+    pa = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Columns every employee CSV must provide
+REQUIRED_COLUMNS = [
+    'employee_id', 'first_name', 'last_name', 'email', 'phone_number', 'department',
+    'job_title', 'hire_date', 'days_service', 'base_salary', 'bonus_percentage',
+    'status', 'birth_date', 'address', 'city', 'state', 'zip_code', 'country',
+    'gender', 'education', 'performance_score', 'last_review_date', 'employee_level',
+    'vacation_days', 'sick_days', 'work_location', 'shift', 'emergency_contact',
+    'ssn', 'bank_account'
+]
+
+# Columns actually read from the CSV; names, contact details, banking data, job titles,
+# zip codes and country are never validated, analysed or plotted
+USED_COLUMNS = [
+    'employee_id', 'department', 'hire_date', 'days_service', 'base_salary',
+    'bonus_percentage', 'status', 'birth_date', 'city', 'state',
+    'gender', 'education', 'performance_score', 'last_review_date', 'employee_level',
+    'vacation_days', 'sick_days', 'work_location', 'shift'
+]
+
+CATEGORICAL_COLUMNS = [
+    'department', 'gender', 'education', 'employee_level', 'work_location', 'shift',
+    'status', 'city', 'state'
+]
+
+EMPLOYEE_ID_PATTERN = re.compile(r'^EMP\d{9}$')
+
+DATE_COLUMNS = ['birth_date', 'hire_date', 'last_review_date']
+DATE_FORMAT = '%Y-%m-%d'
+# Dtype pandas parses dates to (datetime64[ns] before pandas 3, [us] from 3); Arrow's dates are cast to it
+DATE_DTYPE = pd.to_datetime(pd.Series(['2000-01-01']), format=DATE_FORMAT).dtype
+
+# Parse-time dtypes so read_csv skips type inference
+COLUMN_DTYPES = {
+    'employee_id': str,
+    'base_salary': np.float64,
+    'bonus_percentage': np.float32,
+    'performance_score': np.float64,
+    'days_service': 'Int32',
+    'vacation_days': 'Int16',
+    'sick_days': 'Int16',
+    **{col: 'category' for col in CATEGORICAL_COLUMNS},
+}
+
+# Numeric columns; values that are not numbers become missing instead of failing the load
+NUMERIC_COLUMNS = ['base_salary', 'bonus_percentage', 'performance_score', 'days_service', 'vacation_days',
+                   'sick_days']
+
+# Categorical distribution plots: column -> (chart kind, axis label, figure size, number of top values shown)
+DISTRIBUTION_PLOTS = {
+    'department': ('bar', 'Department', (12, 6), None),
+    'gender': ('pie', 'Gender', (8, 8), None),
+    'education': ('bar', 'Education Level', (10, 6), None),
+    'city': ('bar', 'City', (12, 6), 10),
+    'state': ('bar', 'State', (12, 6), None),
+    'employee_level': ('pie', 'Employee Level', (8, 8), None),
+    'work_location': ('pie', 'Work Location', (8, 8), None),
+    'shift': ('pie', 'Shift', (8, 8), None),
+    'status': ('pie', 'Status', (8, 8), None),
+}
+
+# Label of the figure every plot function draws into
+SHARED_FIGURE = 'employee_analysis'
+
+# Extra savefig arguments applied to every plot, e.g. a lower dpi or PNG compress_level
+# where the images are throwaway (the tests)
+SAVEFIG_KWARGS = {}
+
+# Files larger than this are parsed with Arrow's CSV reader (also when chunked) when pyarrow is installed
+ARROW_MIN_FILE_SIZE = 64 << 10
+
+# Copy-on-write is always on from pandas 3; on pandas 2 it depends on mode.copy_on_write
+_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3 or pd.options.mode.copy_on_write is True
+
+# Cleaned numeric columns are narrowed to these widths before analysis
+FLOAT32_COLUMNS = ['base_salary', 'bonus_percentage', 'performance_score']
+INTEGER_COLUMNS = ['days_service', 'vacation_days', 'sick_days', 'age']
+
 
 def ensure_plot_directory(directory="plotsBig"):
     """
@@ -21,472 +111,767 @@ def ensure_plot_directory(directory="plotsBig"):
     return directory
 
 
-def load_and_clean_data(file_path):
+def _strip_categories(series):
     """
-    Load and clean employee data from CSV, with improved error detection.
+    Strip whitespace from the string category labels of a categorical Series, mapping blank
+    labels to NaN. Only the distinct labels are touched, not every row; non-string labels
+    (e.g. integer codes) are left as they are.
+    """
+    categories = series.cat.categories
+    if not pd.api.types.is_string_dtype(categories):
+        return series
+    stripped = categories.str.strip()
+    stripped = stripped.where(stripped != '', np.nan)
+    return series.map(dict(zip(categories, stripped))).astype('category')
+
+
+def _count_invalid(data, mask, columns):
+    """
+    Count the rows flagged by a validation mask, with the first few of them (None if none are flagged).
+    """
+    count = int(mask.sum())
+    return count, data.loc[mask, columns].head() if count else None
+
+
+def _report_invalid(description, count, flagged):
+    """
+    Log a warning with the number of rows flagged by a check and the first of them, if any.
+    """
+    if count:
+        logging.warning("Found %d %s:\n%s", count, description, flagged)
+
+
+def _shapiro_p_value(values):
+    """
+    Shapiro-Wilk p-value of a Series on a sample of at most 5000 values.
+    The sample is drawn with a fixed seed so repeated runs give the same p-value.
+    Returns NaN when fewer than 50 values are available, as the test is not reliable there.
+    """
+    # The length check is constant time, so tiny inputs skip the copy below entirely
+    if len(values) < 50:
+        return np.nan
+    values = values.dropna().to_numpy(dtype=np.float64)
+    if len(values) < 50:
+        return np.nan
+    rng = np.random.default_rng(0)
+    sample = rng.choice(values, size=min(5000, len(values)), replace=False)
+    stat, p_value = stats.shapiro(sample)
+    return p_value
+
+
+def _downcast_numeric(data):
+    """
+    Narrow numeric columns to the smallest dtype that holds their values.
+    Floats become float32; integer columns are downcast to the smallest (nullable) integer that fits.
+    """
+    for col in FLOAT32_COLUMNS:
+        data[col] = data[col].astype(np.float32)
+    for col in INTEGER_COLUMNS:
+        data[col] = pd.to_numeric(data[col], downcast='integer')
+    return data
+
+
+def _coerce_numeric(data):
+    """
+    Convert the numeric columns of raw data to their COLUMN_DTYPES, turning values that are not
+    numbers (or not whole numbers, for the integer columns) into missing values.
+    """
+    for col in NUMERIC_COLUMNS:
+        values = pd.to_numeric(data[col], errors='coerce')
+        if pd.api.types.is_integer_dtype(pd.api.types.pandas_dtype(COLUMN_DTYPES[col])):
+            values = values.where(values % 1 == 0)
+        data[col] = values.astype(COLUMN_DTYPES[col])
+    return data
+
+
+def _to_column_dtypes(data):
+    """
+    Cast raw columns to COLUMN_DTYPES. If a numeric column holds values that are not numbers,
+    those values become missing instead of failing the cast.
+    """
+    try:
+        return data.astype(COLUMN_DTYPES)
+    except (ValueError, TypeError) as e:
+        logging.warning(f"Non-numeric values found, treating them as missing: {e}")
+        text_columns = {col: dtype for col, dtype in COLUMN_DTYPES.items() if col not in NUMERIC_COLUMNS}
+        return _coerce_numeric(data.astype(text_columns))
+
+
+def _clean_chunk(data):
+    """
+    Validate and filter one block of raw employee rows.
+    Rows failing the cheap numeric checks are dropped before any dates are parsed.
+    Checks that need every row (duplicate IDs, salary outliers) are left to the caller.
+
+    Returns:
+        tuple: The cleaned block; a dict of check description -> (count, first flagged rows);
+            and the missing values per column (None when neither is logged). Nothing is
+            logged here, so the caller reports the totals over all blocks once.
+    """
+    warn = logging.getLogger().isEnabledFor(logging.WARNING)
+    invalid = {}
+    # Error Detection: every check is a boolean mask over the underlying numpy arrays
+    # (NaN/NaT compare False, so missing values are only flagged where checked explicitly)
+    salary = data['base_salary'].to_numpy(dtype=np.float64, na_value=np.nan)
+    performance = data['performance_score'].to_numpy(dtype=np.float64, na_value=np.nan)
+    vacation = data['vacation_days'].to_numpy(dtype=np.float64, na_value=np.nan)
+    sick = data['sick_days'].to_numpy(dtype=np.float64, na_value=np.nan)
+    # Day counts fit exactly in float32, which halves the bytes scanned by the checks below
+    days_service = data['days_service'].to_numpy(dtype=np.float32, na_value=np.nan)
+
+    checks = [
+        # Should be EMP followed by 9 digits
+        ('invalid employee IDs',
+         ~data['employee_id'].astype(str).str.match(EMPLOYEE_ID_PATTERN, na=False).to_numpy(), ['employee_id']),
+        ('negative salaries', salary < 0, ['employee_id', 'base_salary']),
+        ('invalid performance scores', (performance < 0) | (performance > 100),
+         ['employee_id', 'performance_score']),
+        ('negative vacation days', vacation < 0, ['employee_id', 'vacation_days']),
+        ('negative sick days', sick < 0, ['employee_id', 'sick_days']),
+        ('negative days_service', days_service < 0, ['employee_id', 'days_service']),
+        # Dropped by the numeric filter below, so they never reach the missing-values summary
+        ('rows missing base_salary or performance_score', np.isnan(salary) | np.isnan(performance),
+         ['employee_id', 'base_salary', 'performance_score']),
+    ]
+    if warn:
+        for description, mask, columns in checks:
+            invalid[description] = _count_invalid(data, mask, columns)
+
+    # Salary present and non-negative, performance score within 0-100
+    numeric_mask = np.logical_and.reduce([salary >= 0, performance >= 0, performance <= 100])
+    if not numeric_mask.all():
+        # Explicit (shallow) copy: columns are assigned below, which pandas 2 warns about on a slice
+        data = data[numeric_mask].copy(deep=False)
+        days_service = days_service[numeric_mask]
+
+    # Columns containing unparseable dates are left as strings by the readers;
+    # only the rows that survived the numeric checks are converted
+    for col in DATE_COLUMNS:
+        if not pd.api.types.is_datetime64_any_dtype(data[col]):
+            data[col] = pd.to_datetime(data[col], format=DATE_FORMAT, errors='coerce', cache=True)
+
+    # Dates as whole days; NaT compares False against any date
+    current_date = np.datetime64('2025-05-01', 'D')
+    birth = data['birth_date'].to_numpy().astype('datetime64[D]')
+    hire = data['hire_date'].to_numpy().astype('datetime64[D]')
+    review = data['last_review_date'].to_numpy().astype('datetime64[D]')
+
+    # Calculate age from integer day differences (missing for unknown or future birth dates)
+    valid_birth_dates = birth <= current_date
+    age_days = np.where(valid_birth_dates, (current_date - birth).astype(np.int64), 0)
+    # round(days / 365.25) in integer arithmetic: (8 * days + 1461) // 2922 never lands on a tie
+    data['age'] = pd.arrays.IntegerArray(((8 * age_days + 1461) // 2922).astype(np.int16), ~valid_birth_dates)
+
+    # Clean categorical columns (every reader types them as category)
+    for col in ['department', 'status', 'gender', 'education', 'employee_level', 'work_location', 'shift']:
+        data[col] = _strip_categories(data[col])
+
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(f"Memory usage by column:\n{data.memory_usage(deep=True)}")
+
+    valid_hire_dates = hire <= current_date
+    service_days = np.where(valid_hire_dates, (current_date - hire).astype(np.int64), 0)
+    data['calculated_days_service'] = pd.arrays.IntegerArray(service_days.astype(np.int32), ~valid_hire_dates)
+    calculated_days_service = service_days.astype(np.float32)
+    calculated_days_service[~valid_hire_dates] = np.nan
+    age = data['age'].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    checks = [
+        ('future birth dates', birth > current_date, ['employee_id', 'birth_date']),
+        ('future hire dates', hire > current_date, ['employee_id', 'hire_date']),
+        ('future last review dates', review > current_date, ['employee_id', 'last_review_date']),
+        ('employees under 18', age < 18, ['employee_id', 'age', 'birth_date']),
+        # Threshold of 30 days to detect only significant inconsistencies
+        ('inconsistent days_service vs hire_date', np.abs(days_service - calculated_days_service) > 30,
+         ['employee_id', 'days_service', 'calculated_days_service']),
+    ]
+    if warn:
+        for description, mask, columns in checks:
+            invalid[description] = _count_invalid(data, mask, columns)
+
+    # Missing values, summed over all blocks by the caller
+    missing = data.isna().sum() if logging.getLogger().isEnabledFor(logging.INFO) else None
+
+    # Filter out the remaining invalid rows in a single pass: age of at least 18,
+    # birth and hire dates present and not in the future, and no future review date
+    keep_mask = np.logical_and.reduce([
+        age >= 18,
+        valid_birth_dates,
+        valid_hire_dates,
+        ~(review > current_date),
+    ])
+    data = data[keep_mask].reset_index(drop=True)
+
+    # Drop categories left without rows so counts and legends only show present values
+    for col in CATEGORICAL_COLUMNS:
+        data[col] = data[col].cat.remove_unused_categories()
+    data = _downcast_numeric(data)
+    return data, invalid, missing
+
+
+def _concat_chunks(chunks):
+    """
+    Concatenate cleaned chunks, merging the per-chunk categories of categorical columns.
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+    # Categorical columns are merged with union_categoricals rather than pd.concat, which
+    # falls back to object (and warns on pandas 2) when a block's column is entirely missing
+    columns = {}
+    for col in CATEGORICAL_COLUMNS:
+        # Such a block has categories of a different dtype (e.g. object instead of str);
+        # give every block the same string categories first
+        columns[col] = union_categoricals(
+            [chunk[col].cat.set_categories(chunk[col].cat.categories.astype(str)) for chunk in chunks],
+            sort_categories=True,
+        )
+    data = pd.concat([chunk.drop(columns=CATEGORICAL_COLUMNS) for chunk in chunks], ignore_index=True)
+    # Put them back in their original positions (in order, so each position is already valid)
+    for position, col in sorted((chunks[0].columns.get_loc(col), col) for col in CATEGORICAL_COLUMNS):
+        data.insert(position, col, columns[col])
+    return data
+
+
+def _clean_chunks(raw_chunks):
+    """
+    Clean an iterable of raw blocks one at a time and combine them with _finish_cleaning.
+    """
+    cleaned_chunks = []
+    employee_ids = []
+    for chunk in raw_chunks:
+        employee_ids.append(chunk['employee_id'])
+        cleaned_chunks.append(_clean_chunk(chunk))
+    return _finish_cleaning(cleaned_chunks, employee_ids)
+
+
+def _finish_cleaning(cleaned_chunks, employee_ids):
+    """
+    Combine the blocks returned by _clean_chunk, log the totals of their checks and run the
+    checks that need every row: duplicate employee IDs (over the raw IDs of all blocks) and
+    salary outliers.
+    """
+    chunks, invalid, missing = zip(*cleaned_chunks)
+
+    # One warning per check, with the rows flagged in the first block that had any
+    for description in invalid[0]:
+        results = [chunk_invalid[description] for chunk_invalid in invalid]
+        flagged = next((rows for _, rows in results if rows is not None), None)
+        _report_invalid(description, sum(count for count, _ in results), flagged)
+
+    if missing[0] is not None:
+        logging.info("Missing values:\n%s", sum(missing[1:], missing[0]))
+
+    data = _concat_chunks(list(chunks))
+
+    # employee_id is the primary key: duplicates are checked across the whole input
+    if logging.getLogger().isEnabledFor(logging.WARNING):
+        employee_ids = pd.concat(employee_ids, ignore_index=True).to_frame()
+        _report_invalid('duplicate employee IDs', *_count_invalid(
+            employee_ids, employee_ids['employee_id'].duplicated(keep=False).to_numpy(), ['employee_id']))
+
+    # Detect outliers in base_salary
+    salaries = data['base_salary'].to_numpy(dtype=np.float32)
+    salaries = salaries[~np.isnan(salaries)]
+    if len(salaries):
+        # Both quartiles from a single partition pass
+        Q1, Q3 = np.percentile(salaries, [25, 75])
+        IQR = Q3 - Q1
+        n_outliers = int(((salaries < Q1 - 1.5 * IQR) | (salaries > Q3 + 1.5 * IQR)).sum())
+        if n_outliers:
+            logging.warning(f"Found {n_outliers} salary outliers after cleaning")
+
+    logging.info(f"Data shape after cleaning: {data.shape}")
+    return data
+
+
+def _arrow_to_pandas(table):
+    """
+    Convert a table read by the Arrow CSV reader to the dtypes the C parser produces.
+    """
+    data = _to_column_dtypes(table.to_pandas())
+    for col in DATE_COLUMNS:
+        data[col] = data[col].astype(DATE_DTYPE)
+    # Arrow keeps categories in order of appearance; the C parser sorts them
+    for col in CATEGORICAL_COLUMNS:
+        data[col] = data[col].cat.reorder_categories(data[col].cat.categories.sort_values())
+    return data
+
+
+def _read_csv_arrow(file_path, chunksize=None):
+    """
+    Read the used columns with Arrow's CSV reader, yielding DataFrames with the dtypes the
+    C parser produces: the whole file at once (multithreaded), or blocks of chunksize rows
+    streamed from the file. Raises pa.ArrowInvalid if a value does not parse.
+    """
+    column_types = {col: pa.string() for col, dtype in COLUMN_DTYPES.items() if dtype is str}
+    # Dictionary-encode the categorical columns while parsing so they arrive as categories
+    # without an intermediate column of Python strings
+    column_types.update({col: pa.dictionary(pa.int32(), pa.string()) for col in CATEGORICAL_COLUMNS})
+    column_types.update({col: pa.timestamp('us') for col in DATE_COLUMNS})
+    read_options = pv.ReadOptions(block_size=8 << 20)
+    convert_options = pv.ConvertOptions(
+        include_columns=USED_COLUMNS,
+        column_types=column_types,
+        timestamp_parsers=[DATE_FORMAT],
+        # Empty fields are missing values, as with the C parser
+        strings_can_be_null=True,
+    )
+    if chunksize is None:
+        yield _arrow_to_pandas(pv.read_csv(file_path, read_options=read_options, convert_options=convert_options))
+        return
+
+    # Arrow batches are sized in bytes; re-slice them (zero-copy) into blocks of chunksize rows
+    pending = None
+    for batch in pv.open_csv(file_path, read_options=read_options, convert_options=convert_options):
+        table = pa.Table.from_batches([batch])
+        pending = table if pending is None else pa.concat_tables([pending, table])
+        while pending.num_rows >= chunksize:
+            yield _arrow_to_pandas(pending.slice(0, chunksize))
+            pending = pending.slice(chunksize)
+    if pending is not None and pending.num_rows:
+        yield _arrow_to_pandas(pending)
+
+
+def clean_data(data):
+    """
+    Clean employee data that is already in memory, with the same checks as load_and_clean_data.
 
     Args:
-        file_path (str): Path to the CSV file.
+        data (pd.DataFrame): Raw employee data; columns not used by the analysis may be absent.
 
     Returns:
         pd.DataFrame: Cleaned employee data.
     """
     try:
-        # Read CSV
-        data = pd.read_csv(file_path, low_memory=False)
-
-        # Validate required columns
-        required_columns = [
-            'employee_id', 'first_name', 'last_name', 'email', 'phone_number', 'department',
-            'job_title', 'hire_date', 'days_service', 'base_salary', 'bonus_percentage',
-            'status', 'birth_date', 'address', 'city', 'state', 'zip_code', 'country',
-            'gender', 'education', 'performance_score', 'last_review_date', 'employee_level',
-            'vacation_days', 'sick_days', 'work_location', 'shift', 'emergency_contact',
-            'ssn', 'bank_account'
-        ]
-        missing_cols = [col for col in required_columns if col not in data.columns]
+        missing_cols = [col for col in USED_COLUMNS if col not in data.columns]
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
 
-        # Clean data
-        data = data.copy()
-
-        # Error Detection (before any conversions)
-        # 1. Duplicate employee IDs
-        duplicate_ids = data[data['employee_id'].duplicated(keep=False)]
-        if not duplicate_ids.empty:
-            logging.warning(
-                f"Found {len(duplicate_ids)} duplicate employee IDs:\n{duplicate_ids[['employee_id']].head()}")
-
-        # 2. Invalid employee_id format (should be EMP followed by 9 digits)
-        invalid_ids = data[~data['employee_id'].apply(lambda x: bool(re.match(r'EMP\d{9}', str(x))))]
-        if not invalid_ids.empty:
-            logging.warning(f"Found {len(invalid_ids)} invalid employee IDs:\n{invalid_ids[['employee_id']].head()}")
-
-        # 3. Future birth dates, hire dates, and last review dates
-        current_date = pd.Timestamp('2025-05-01')
-
-        # Convert dates for error detection (but keep raw values)
-        data['birth_date_raw'] = data['birth_date']
-        data['hire_date_raw'] = data['hire_date']
-        data['birth_date'] = pd.to_datetime(data['birth_date'], errors='coerce')
-        data['hire_date'] = pd.to_datetime(data['hire_date'], errors='coerce')
-        data['last_review_date'] = pd.to_datetime(data['last_review_date'], errors='coerce')
-
-        future_birth_dates = data[data['birth_date'].notna() & (data['birth_date'] > current_date)]
-        if not future_birth_dates.empty:
-            logging.warning(
-                f"Found {len(future_birth_dates)} future birth dates:\n{future_birth_dates[['employee_id', 'birth_date']].head()}")
-
-        future_hire_dates = data[data['hire_date'].notna() & (data['hire_date'] > current_date)]
-        if not future_hire_dates.empty:
-            logging.warning(
-                f"Found {len(future_hire_dates)} future hire dates:\n{future_hire_dates[['employee_id', 'hire_date']].head()}")
-
-        future_review_dates = data[data['last_review_date'].notna() & (data['last_review_date'] > current_date)]
-        if not future_review_dates.empty:
-            logging.warning(
-                f"Found {len(future_review_dates)} future last review dates:\n{future_review_dates[['employee_id', 'last_review_date']].head()}")
-
-        # 4. Negative salaries and other numerical errors
-        data['base_salary_raw'] = data['base_salary']
-        data['performance_score_raw'] = data['performance_score']
-        data['vacation_days_raw'] = data['vacation_days']
-        data['sick_days_raw'] = data['sick_days']
-        data['days_service_raw'] = data['days_service']
-
-        # Convert numerical columns after error detection
-        data['base_salary'] = pd.to_numeric(data['base_salary'], errors='coerce')
-        data['performance_score'] = pd.to_numeric(data['performance_score'], errors='coerce')
-        data['vacation_days'] = pd.to_numeric(data['vacation_days'], errors='coerce')
-        data['sick_days'] = pd.to_numeric(data['sick_days'], errors='coerce')
-        data['days_service'] = pd.to_numeric(data['days_service'], errors='coerce')
-        data['bonus_percentage'] = pd.to_numeric(data['bonus_percentage'], errors='coerce')
-
-        # Detect negative salaries
-        negative_salaries = data[data['base_salary'].notna() & (data['base_salary'] < 0)]
-        if not negative_salaries.empty:
-            logging.warning(
-                f"Found {len(negative_salaries)} negative salaries:\n{negative_salaries[['employee_id', 'base_salary']].head()}")
-
-        # Detect invalid performance scores
-        invalid_performance = data[
-            (data['performance_score'].notna()) &
-            ((data['performance_score'] < 0) | (data['performance_score'] > 100))
-            ]
-        if not invalid_performance.empty:
-            logging.warning(
-                f"Found {len(invalid_performance)} invalid performance scores:\n{invalid_performance[['employee_id', 'performance_score']].head()}")
-
-        # Detect negative vacation and sick days
-        negative_vacation_days = data[data['vacation_days'].notna() & (data['vacation_days'] < 0)]
-        if not negative_vacation_days.empty:
-            logging.warning(
-                f"Found {len(negative_vacation_days)} negative vacation days:\n{negative_vacation_days[['employee_id', 'vacation_days']].head()}")
-
-        negative_sick_days = data[data['sick_days'].notna() & (data['sick_days'] < 0)]
-        if not negative_sick_days.empty:
-            logging.warning(
-                f"Found {len(negative_sick_days)} negative sick days:\n{negative_sick_days[['employee_id', 'sick_days']].head()}")
-
-        # Detect negative days_service
-        negative_days_service = data[data['days_service'].notna() & (data['days_service'] < 0)]
-        if not negative_days_service.empty:
-            logging.warning(
-                f"Found {len(negative_days_service)} negative days_service:\n{negative_days_service[['employee_id', 'days_service']].head()}")
-
-        # Calculate age (handle future dates)
-        data['age'] = np.nan
-        valid_birth_dates = data['birth_date'].notna() & (data['birth_date'] <= current_date)
-        data.loc[valid_birth_dates, 'age'] = (current_date - data.loc[valid_birth_dates, 'birth_date']).dt.days / 365.25
-        data['age'] = data['age'].round().astype('Int64')
-
-        # 5. Employees under 18 (only for valid ages)
-        under_18 = data[data['age'].notna() & (data['age'] < 18)]
-        if not under_18.empty:
-            logging.warning(
-                f"Found {len(under_18)} employees under 18:\n{under_18[['employee_id', 'age', 'birth_date']].head()}")
-
-        # Clean categorical columns
-        for col in ['department', 'job_title', 'status', 'gender', 'education', 'employee_level', 'work_location',
-                    'shift']:
-            data[col] = data[col].str.strip().replace('', np.nan) if data[col].dtype == 'object' else data[col]
-
-        # 6. Inconsistent days_service vs hire_date
-        data['calculated_days_service'] = np.nan
-        valid_hire_dates = data['hire_date'].notna() & (data['hire_date'] <= current_date)
-        data.loc[valid_hire_dates, 'calculated_days_service'] = (
-                    current_date - data.loc[valid_hire_dates, 'hire_date']).dt.days
-        # Adjust threshold to detect more significant inconsistencies
-        inconsistent_days = data[
-            data['calculated_days_service'].notna() &
-            data['days_service'].notna() &
-            (abs(data['days_service'] - data['calculated_days_service']) > 30)  # Aumentar umbral a 30 días
-            ]
-        if not inconsistent_days.empty:
-            logging.warning(
-                f"Found {len(inconsistent_days)} inconsistent days_service vs hire_date:\n{inconsistent_days[['employee_id', 'days_service', 'calculated_days_service']].head()}")
-
-        # Log missing values
-        logging.info(f"Missing values:\n{data.isna().sum()}")
-
-        # Remove rows with critical missing data
-        critical_cols = ['base_salary', 'hire_date']
-        data = data.dropna(subset=critical_cols)
-
-        # Filter out invalid data before visualizations
-        # Remove rows with negative salaries
-        data = data[data['base_salary'].notna() & (data['base_salary'] >= 0)]
-        # Remove rows with invalid performance scores
-        data = data[
-            data['performance_score'].notna() & (data['performance_score'] >= 0) & (data['performance_score'] <= 100)]
-        # Remove rows with employees under 18
-        data = data[data['age'].notna() & (data['age'] >= 18)]
-        # Remove rows with future birth dates
-        data = data[data['birth_date'].notna() & (data['birth_date'] <= current_date)]
-
-        # Detect outliers in base_salary
-        Q1 = data['base_salary'].quantile(0.25)
-        Q3 = data['base_salary'].quantile(0.75)
-        IQR = Q3 - Q1
-        outliers = data[(data['base_salary'] < Q1 - 1.5 * IQR) | (data['base_salary'] > Q3 + 1.5 * IQR)]
-        if not outliers.empty:
-            logging.warning(f"Found {len(outliers)} salary outliers after cleaning")
+        # Same columns and dtypes as the CSV reader produces
+        data = _to_column_dtypes(data[USED_COLUMNS])
+        return _finish_cleaning([_clean_chunk(data)], [data['employee_id']])
 
-        logging.info(f"Data shape after cleaning: {data.shape}")
-        return data
+    except Exception as e:
+        logging.error(f"Error cleaning data: {e}")
+        raise
+
+
+def load_and_clean_data(file_path, chunksize=None, memoize=True):
+    """
+    Load and clean employee data from CSV, with improved error detection.
+    Results are memoized per file, so reloading an unchanged CSV in the same process is free.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        chunksize (int, optional): Parse and clean the CSV in blocks of this many rows,
+            so only one raw block is held in memory at a time.
+        memoize (bool): Keep the result for later calls. Callers that load a file once should pass
+            False, so the cleaned frame is not held (and, without copy-on-write, copied) by the cache.
+
+    Returns:
+        pd.DataFrame: Cleaned employee data.
+    """
+    try:
+        # The modification time and size are part of the key, so an edited file is parsed again
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, chunksize)
+        if not memoize:
+            return _load_and_clean_csv.__wrapped__(*key)
+        data = _load_and_clean_csv(*key)
+        # Callers get their own frame so their changes never reach the cached one: a shallow
+        # copy is enough under copy-on-write, otherwise the data has to be copied
+        return data.copy(deep=not _COPY_ON_WRITE)
 
     except Exception as e:
         logging.error(f"Error loading data: {e}")
         raise
 
 
+@functools.lru_cache(maxsize=8)
+def _load_and_clean_csv(file_path, mtime_ns, size, chunksize):
+    """
+    Parse and clean a CSV file; cached by load_and_clean_data on (path, mtime_ns, size, chunksize).
+    """
+    # Validate required columns (header only)
+    header = pd.read_csv(file_path, nrows=0).columns
+    missing_cols = [col for col in REQUIRED_COLUMNS if col not in header]
+    if missing_cols:
+        raise ValueError(f"Missing required columns: {missing_cols}")
+
+    if pa is not None and size > ARROW_MIN_FILE_SIZE:
+        try:
+            return _clean_chunks(_read_csv_arrow(file_path, chunksize))
+        except pa.ArrowInvalid as e:
+            logging.warning(f"Arrow CSV reader failed, falling back to the C parser: {e}")
+
+    try:
+        return _clean_chunks(_read_csv_c(file_path, chunksize, COLUMN_DTYPES))
+    except (ValueError, TypeError) as e:
+        # A value that is not a number fails the typed read; read the numeric columns as text
+        # and coerce them instead, as is done for dates
+        logging.warning(f"Non-numeric values found, re-reading numeric columns as text: {e}")
+        dtypes = {**COLUMN_DTYPES, **{col: str for col in NUMERIC_COLUMNS}}
+        return _clean_chunks(_coerce_numeric(chunk) for chunk in _read_csv_c(file_path, chunksize, dtypes))
+
+
+def _read_csv_c(file_path, chunksize, dtypes):
+    """
+    Read the used columns with pandas' C parser, with dtypes and dates resolved at parse time.
+    Returns a list with the whole frame, or an iterator of chunksize-row blocks.
+    """
+    reader = pd.read_csv(
+        file_path,
+        usecols=USED_COLUMNS,
+        dtype=dtypes,
+        parse_dates=DATE_COLUMNS,
+        date_format=DATE_FORMAT,
+        engine='c',
+        chunksize=chunksize,
+    )
+    return [reader] if chunksize is None else reader
+
+
+def _cache_paths(file_path, cache_dir):
+    """
+    Parquet and sidecar paths caching one CSV, keyed on a hash of its absolute path so files
+    with the same name in different directories never share an entry.
+    """
+    source = os.path.abspath(file_path)
+    stem = os.path.splitext(os.path.basename(source))[0]
+    base = os.path.join(cache_dir, f"{stem}-{hashlib.sha1(source.encode()).hexdigest()[:16]}")
+    return base + ".parquet", base + ".json"
+
+
+@functools.lru_cache(maxsize=None)
+def _cleaning_version():
+    """
+    Hash of this module's source; cached results made by different cleaning code are stale.
+    """
+    with open(__file__, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _cache_key(file_path):
+    """
+    What a cached result must have been built from: the CSV's path, mtime and size, and the cleaning code.
+    """
+    stat = os.stat(file_path)
+    return {
+        'source': os.path.abspath(file_path),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'version': _cleaning_version(),
+    }
+
+
+def load_cached_data(file_path, cache_dir="cache", chunksize=None):
+    """
+    Load cleaned employee data, reusing a Parquet copy of the cleaned frame while the CSV and the
+    cleaning code are unchanged. A JSON sidecar next to the Parquet file records what it was built from.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        cache_dir (str): Directory holding the cached Parquet files.
+        chunksize (int, optional): Rows per block when the CSV has to be parsed, see load_and_clean_data.
+
+    Returns:
+        pd.DataFrame: Cleaned employee data.
+    """
+    cache_path, key_path = _cache_paths(file_path, cache_dir)
+    key = _cache_key(file_path)
+    try:
+        with open(key_path) as f:
+            fresh = json.load(f) == key
+    except (OSError, ValueError):
+        fresh = False
+    if fresh:
+        try:
+            data = pd.read_parquet(cache_path)
+            logging.info(f"Loaded cleaned data from cache {cache_path}")
+            return data
+        except (ImportError, OSError, ValueError) as e:
+            logging.warning(f"Could not read cached data, reloading CSV: {e}")
+
+    # Loaded once per run and cached on disk, so not memoized in memory as well
+    data = load_and_clean_data(file_path, chunksize=chunksize, memoize=False)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        data.to_parquet(cache_path, compression='zstd')
+        # Written last, so a sidecar only ever describes a complete Parquet file
+        with open(key_path, 'w') as f:
+            json.dump(key, f)
+    except (ImportError, OSError, ValueError) as e:
+        # Parquet support needs pyarrow; without it every run parses the CSV
+        logging.warning(f"Could not cache cleaned data: {e}")
+    return data
+
+
+def _start_figure(figsize):
+    """
+    Make the shared plotting figure current, cleared and resized to figsize.
+    Reusing one figure avoids allocating a new figure and canvas for every plot.
+    """
+    import matplotlib.pyplot as plt
+    figure = plt.figure(num=SHARED_FIGURE, clear=True)
+    figure.set_size_inches(figsize)
+    return figure
+
+
+def _save_figure(output_dir, filename):
+    """
+    Save the current figure to output_dir/filename with SAVEFIG_KWARGS applied.
+    """
+    import matplotlib.pyplot as plt
+    plt.savefig(os.path.join(output_dir, filename), **SAVEFIG_KWARGS)
+
+
+def _precompute_counts(data):
+    """
+    Value counts for every column in DISTRIBUTION_PLOTS, computed in one pass so the
+    distribution plots can share them instead of each counting its own column.
+    """
+    return {col: data[col].value_counts() for col in DISTRIBUTION_PLOTS}
+
+
+def _sample_rows(data, max_rows=20_000):
+    """
+    Random subset of at most max_rows rows, drawn with a fixed seed.
+    Scatter plots look the same at that density while rendering far fewer points.
+    """
+    if len(data) <= max_rows:
+        return data
+    rows = np.random.default_rng(0).choice(len(data), size=max_rows, replace=False)
+    return data.iloc[np.sort(rows)]
+
+
+def _plot_histogram(values, color, bins=50):
+    """
+    Draw a histogram of a Series from precomputed np.histogram counts, with a KDE overlay
+    fitted on at most 10,000 sampled values and scaled to the bar heights.
+    """
+    import matplotlib.pyplot as plt
+    values = values.dropna().to_numpy(dtype=np.float64)
+    counts, edges = np.histogram(values, bins=bins)
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color=color, alpha=0.6, edgecolor='white')
+
+    sample = np.random.default_rng(0).choice(values, size=min(10_000, len(values)), replace=False)
+    if len(sample) > 1 and np.ptp(sample) > 0:
+        kde = stats.gaussian_kde(sample)
+        xs = np.linspace(values.min(), values.max(), 200)
+        plt.plot(xs, kde(xs) * counts.sum() * (edges[1] - edges[0]), color=color)
+
+
 # Funciones de visualización existentes
 def plot_salary_vs_age(data, output_dir="plotsBig"):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     if data.empty:
         logging.warning("Cannot plot salary vs age: DataFrame is empty")
         return
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(10, 6))
-    sns.scatterplot(x='age', y='base_salary', hue='gender', data=data, alpha=0.6)
+    _start_figure((10, 6))
+    sns.scatterplot(x='age', y='base_salary', hue='gender', data=_sample_rows(data), alpha=0.6,
+                    rasterized=True)
     plt.title("Salary vs. Age by Gender", fontsize=16)
     plt.xlabel("Age", fontsize=12)
     plt.ylabel("Base Salary ($)", fontsize=12)
     plt.grid(True)
     plt.legend(loc='upper right')
-    plt.savefig(os.path.join(output_dir, "salary_vs_age.png"))
-    plt.close()
+    _save_figure(output_dir, "salary_vs_age.png")
 
 
 def plot_days_service_vs_vacation(data, output_dir="plotsBig"):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     if data.empty:
         logging.warning("Cannot plot days_service vs vacation_days: DataFrame is empty")
         return
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(10, 6))
-    sns.scatterplot(x='days_service', y='vacation_days', hue='employee_level', data=data, alpha=0.6)
+    _start_figure((10, 6))
+    sns.scatterplot(x='days_service', y='vacation_days', hue='employee_level', data=_sample_rows(data), alpha=0.6,
+                    rasterized=True)
     plt.title("Days of Service vs. Vacation Days by Employee Level", fontsize=16)
     plt.xlabel("Days of Service", fontsize=12)
     plt.ylabel("Vacation Days", fontsize=12)
     plt.grid(True)
     plt.legend(loc='upper right')
-    plt.savefig(os.path.join(output_dir, "days_service_vs_vacation.png"))
-    plt.close()
+    _save_figure(output_dir, "days_service_vs_vacation.png")
 
 
-def plot_salary_distribution(data, output_dir="plotsBig"):
+def plot_salary_distribution(data, output_dir="plotsBig", shapiro_p=None):
+    import matplotlib.pyplot as plt
     if data.empty:
         logging.warning("Cannot plot salary distribution: DataFrame is empty")
         return
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(10, 6))
-    sns.histplot(data['base_salary'].dropna(), kde=True, color='blue', bins=50)
+    _start_figure((10, 6))
+    _plot_histogram(data['base_salary'], color='blue', bins=50)
     plt.title("Salary Distribution", fontsize=16)
     plt.xlabel("Base Salary ($)", fontsize=12)
     plt.ylabel("Frequency", fontsize=12)
     plt.grid(True)
 
-    salary_data = data['base_salary'].dropna()
-    if len(salary_data) >= 50:
-        sample_size = min(5000, len(salary_data))
-        stat, p_value = stats.shapiro(salary_data.sample(sample_size))
-        plt.annotate(f"Shapiro-Wilk p-value: {p_value:.4f}", xy=(0.05, 0.95), xycoords='axes fraction')
+    if shapiro_p is None:
+        shapiro_p = _shapiro_p_value(data['base_salary'])
+    if not np.isnan(shapiro_p):
+        plt.annotate(f"Shapiro-Wilk p-value: {shapiro_p:.4f}", xy=(0.05, 0.95), xycoords='axes fraction')
     else:
         logging.warning("Dataset too small for reliable Shapiro-Wilk test")
 
-    plt.savefig(os.path.join(output_dir, "salary_distribution.png"))
-    plt.close()
+    _save_figure(output_dir, "salary_distribution.png")
 
 
 def plot_gender_salary_distribution(data, output_dir="plotsBig"):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     if data.empty:
         logging.warning("Cannot plot gender salary distribution: DataFrame is empty")
         return
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(10, 6))
+    _start_figure((10, 6))
     sns.boxplot(x='gender', y='base_salary', data=data)
     plt.title("Salary Distribution by Gender", fontsize=16)
     plt.xlabel("Gender", fontsize=12)
     plt.ylabel("Base Salary ($)", fontsize=12)
     plt.grid(True)
-    plt.savefig(os.path.join(output_dir, "gender_salary_distribution.png"))
-    plt.close()
+    _save_figure(output_dir, "gender_salary_distribution.png")
 
 
 def plot_gender_performance_distribution(data, output_dir="plotsBig"):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     if data.empty:
         logging.warning("Cannot plot gender performance distribution: DataFrame is empty")
         return
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(10, 6))
+    _start_figure((10, 6))
     sns.boxplot(x='gender', y='performance_score', data=data)
     plt.title("Performance Score Distribution by Gender", fontsize=16)
     plt.xlabel("Gender", fontsize=12)
     plt.ylabel("Performance Score", fontsize=12)
     plt.grid(True)
-    plt.savefig(os.path.join(output_dir, "gender_performance_distribution.png"))
-    plt.close()
+    _save_figure(output_dir, "gender_performance_distribution.png")
 
 
-def plot_performance_distribution(data, output_dir="plotsBig"):
+def plot_performance_distribution(data, output_dir="plotsBig", shapiro_p=None):
+    import matplotlib.pyplot as plt
     if data.empty:
         logging.warning("Cannot plot performance distribution: DataFrame is empty")
         return
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(10, 6))
-    sns.histplot(data['performance_score'].dropna(), kde=True, color='green', bins=50)
+    _start_figure((10, 6))
+    _plot_histogram(data['performance_score'], color='green', bins=50)
     plt.title("Performance Score Distribution", fontsize=16)
     plt.xlabel("Performance Score", fontsize=12)
     plt.ylabel("Frequency", fontsize=12)
     plt.grid(True)
 
-    performance_data = data['performance_score'].dropna()
-    if len(performance_data) >= 50:
-        sample_size = min(5000, len(performance_data))
-        stat, p_value = stats.shapiro(performance_data.sample(sample_size))
-        plt.annotate(f"Shapiro-Wilk p-value: {p_value:.4f}", xy=(0.05, 0.95), xycoords='axes fraction')
+    if shapiro_p is None:
+        shapiro_p = _shapiro_p_value(data['performance_score'])
+    if not np.isnan(shapiro_p):
+        plt.annotate(f"Shapiro-Wilk p-value: {shapiro_p:.4f}", xy=(0.05, 0.95), xycoords='axes fraction')
     else:
         logging.warning("Dataset too small for reliable Shapiro-Wilk test")
 
-    plt.savefig(os.path.join(output_dir, "performance_distribution.png"))
-    plt.close()
+    _save_figure(output_dir, "performance_distribution.png")
 
 
 # Nuevas funciones de visualización
-def plot_department_distribution(data, output_dir="plotsBig"):
+def plot_distribution(data, column, output_dir="plotsBig", counts=None):
     """
-    Plot the distribution of employees by department using a bar chart.
+    Plot the distribution of employees by a categorical column, as configured in DISTRIBUTION_PLOTS.
+    Precomputed value counts for the column can be passed as counts.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    kind, label, figsize, top_n = DISTRIBUTION_PLOTS[column]
     if data.empty:
-        logging.warning("Cannot plot department distribution: DataFrame is empty")
+        logging.warning(f"Cannot plot {column.replace('_', ' ')} distribution: DataFrame is empty")
         return
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(12, 6))
-    sns.countplot(x='department', data=data, order=data['department'].value_counts().index)
-    plt.title("Distribution of Employees by Department", fontsize=16)
-    plt.xlabel("Department", fontsize=12)
-    plt.ylabel("Number of Employees", fontsize=12)
-    plt.xticks(rotation=45, ha='right')
-    plt.grid(True, axis='y')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "department_distribution.png"))
-    plt.close()
+    if counts is None:
+        counts = data[column].value_counts()
+    title = f"Distribution of Employees by {label}"
+    if top_n is not None:
+        counts = counts.nlargest(top_n)
+        title += f" (Top {top_n})"
+
+    _start_figure(figsize)
+    if kind == 'pie':
+        plt.pie(counts, labels=counts.index, autopct='%1.1f%%', startangle=140)
+        plt.title(title, fontsize=16)
+    else:
+        sns.barplot(x=counts.index, y=counts.values, order=list(counts.index))
+        plt.title(title, fontsize=16)
+        plt.xlabel(label, fontsize=12)
+        plt.ylabel("Number of Employees", fontsize=12)
+        plt.xticks(rotation=45, ha='right')
+        plt.grid(True, axis='y')
+        plt.tight_layout()
+    _save_figure(output_dir, f"{column}_distribution.png")
 
 
-def plot_gender_distribution(data, output_dir="plotsBig"):
+def plot_department_distribution(data, output_dir="plotsBig", counts=None):
     """
-    Plot the distribution of employees by gender using a pie chart.
+    Plot the distribution of employees by department using a bar chart.
     """
-    if data.empty:
-        logging.warning("Cannot plot gender distribution: DataFrame is empty")
-        return
+    plot_distribution(data, 'department', output_dir, counts)
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(8, 8))
-    gender_counts = data['gender'].value_counts()
-    plt.pie(gender_counts, labels=gender_counts.index, autopct='%1.1f%%', startangle=140)
-    plt.title("Distribution of Employees by Gender", fontsize=16)
-    plt.savefig(os.path.join(output_dir, "gender_distribution.png"))
-    plt.close()
 
+def plot_gender_distribution(data, output_dir="plotsBig", counts=None):
+    """
+    Plot the distribution of employees by gender using a pie chart.
+    """
+    plot_distribution(data, 'gender', output_dir, counts)
 
-def plot_education_distribution(data, output_dir="plotsBig"):
+
+def plot_education_distribution(data, output_dir="plotsBig", counts=None):
     """
     Plot the distribution of employees by education level using a bar chart.
     """
-    if data.empty:
-        logging.warning("Cannot plot education distribution: DataFrame is empty")
-        return
-
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(10, 6))
-    sns.countplot(x='education', data=data, order=data['education'].value_counts().index)
-    plt.title("Distribution of Employees by Education Level", fontsize=16)
-    plt.xlabel("Education Level", fontsize=12)
-    plt.ylabel("Number of Employees", fontsize=12)
-    plt.xticks(rotation=45, ha='right')
-    plt.grid(True, axis='y')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "education_distribution.png"))
-    plt.close()
+    plot_distribution(data, 'education', output_dir, counts)
 
 
-def plot_city_distribution(data, output_dir="plotsBig"):
+def plot_city_distribution(data, output_dir="plotsBig", counts=None):
     """
     Plot the distribution of employees by city (top 10 cities) using a bar chart.
     """
-    if data.empty:
-        logging.warning("Cannot plot city distribution: DataFrame is empty")
-        return
-
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(12, 6))
-    top_cities = data['city'].value_counts().nlargest(10)
-    sns.barplot(x=top_cities.index, y=top_cities.values)
-    plt.title("Distribution of Employees by City (Top 10)", fontsize=16)
-    plt.xlabel("City", fontsize=12)
-    plt.ylabel("Number of Employees", fontsize=12)
-    plt.xticks(rotation=45, ha='right')
-    plt.grid(True, axis='y')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "city_distribution.png"))
-    plt.close()
+    plot_distribution(data, 'city', output_dir, counts)
 
 
-def plot_state_distribution(data, output_dir="plotsBig"):
+def plot_state_distribution(data, output_dir="plotsBig", counts=None):
     """
     Plot the distribution of employees by state using a bar chart.
     """
-    if data.empty:
-        logging.warning("Cannot plot state distribution: DataFrame is empty")
-        return
-
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(12, 6))
-    sns.countplot(x='state', data=data, order=data['state'].value_counts().index)
-    plt.title("Distribution of Employees by State", fontsize=16)
-    plt.xlabel("State", fontsize=12)
-    plt.ylabel("Number of Employees", fontsize=12)
-    plt.xticks(rotation=45, ha='right')
-    plt.grid(True, axis='y')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "state_distribution.png"))
-    plt.close()
+    plot_distribution(data, 'state', output_dir, counts)
 
 
-def plot_employee_level_distribution(data, output_dir="plotsBig"):
+def plot_employee_level_distribution(data, output_dir="plotsBig", counts=None):
     """
     Plot the distribution of employees by employee level using a pie chart.
     """
-    if data.empty:
-        logging.warning("Cannot plot employee level distribution: DataFrame is empty")
-        return
+    plot_distribution(data, 'employee_level', output_dir, counts)
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(8, 8))
-    level_counts = data['employee_level'].value_counts()
-    plt.pie(level_counts, labels=level_counts.index, autopct='%1.1f%%', startangle=140)
-    plt.title("Distribution of Employees by Employee Level", fontsize=16)
-    plt.savefig(os.path.join(output_dir, "employee_level_distribution.png"))
-    plt.close()
 
-
-def plot_work_location_distribution(data, output_dir="plotsBig"):
+def plot_work_location_distribution(data, output_dir="plotsBig", counts=None):
     """
     Plot the distribution of employees by work location using a pie chart.
     """
-    if data.empty:
-        logging.warning("Cannot plot work location distribution: DataFrame is empty")
-        return
+    plot_distribution(data, 'work_location', output_dir, counts)
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(8, 8))
-    location_counts = data['work_location'].value_counts()
-    plt.pie(location_counts, labels=location_counts.index, autopct='%1.1f%%', startangle=140)
-    plt.title("Distribution of Employees by Work Location", fontsize=16)
-    plt.savefig(os.path.join(output_dir, "work_location_distribution.png"))
-    plt.close()
 
-
-def plot_shift_distribution(data, output_dir="plotsBig"):
+def plot_shift_distribution(data, output_dir="plotsBig", counts=None):
     """
     Plot the distribution of employees by shift using a pie chart.
     """
-    if data.empty:
-        logging.warning("Cannot plot shift distribution: DataFrame is empty")
-        return
+    plot_distribution(data, 'shift', output_dir, counts)
 
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(8, 8))
-    shift_counts = data['shift'].value_counts()
-    plt.pie(shift_counts, labels=shift_counts.index, autopct='%1.1f%%', startangle=140)
-    plt.title("Distribution of Employees by Shift", fontsize=16)
-    plt.savefig(os.path.join(output_dir, "shift_distribution.png"))
-    plt.close()
 
-
-def plot_status_distribution(data, output_dir="plotsBig"):
+def plot_status_distribution(data, output_dir="plotsBig", counts=None):
     """
     Plot the distribution of employees by status using a pie chart.
     """
-    if data.empty:
-        logging.warning("Cannot plot status distribution: DataFrame is empty")
-        return
-
-    ensure_plot_directory(output_dir)
-    plt.figure(figsize=(8, 8))
-    status_counts = data['status'].value_counts()
-    plt.pie(status_counts, labels=status_counts.index, autopct='%1.1f%%', startangle=140)
-    plt.title("Distribution of Employees by Status", fontsize=16)
-    plt.savefig(os.path.join(output_dir, "status_distribution.png"))
-    plt.close()
+    plot_distribution(data, 'status', output_dir, counts)
 
 
 def analyze_data(data):
@@ -504,30 +889,38 @@ def analyze_data(data):
         'performance_score': {'p_value': np.nan, 'is_normal': False},
         'vacation_days': {'p_value': np.nan, 'is_normal': False}
     }
-    salary_data = data['base_salary'].dropna()
-    performance_data = data['performance_score'].dropna()
-    vacation_data = data['vacation_days'].dropna()
-    if len(salary_data) >= 50:
-        sample_size = min(5000, len(salary_data))
-        stat, p_salary = stats.shapiro(salary_data.sample(sample_size))
-        analysis['normality']['base_salary'] = {'p_value': p_salary, 'is_normal': p_salary > 0.05}
-    if len(performance_data) >= 50:
-        sample_size = min(5000, len(performance_data))
-        stat, p_performance = stats.shapiro(performance_data.sample(sample_size))
-        analysis['normality']['performance_score'] = {'p_value': p_performance, 'is_normal': p_performance > 0.05}
-    if len(vacation_data) >= 50:
-        sample_size = min(5000, len(vacation_data))
-        stat, p_vacation = stats.shapiro(vacation_data.sample(sample_size))
-        analysis['normality']['vacation_days'] = {'p_value': p_vacation, 'is_normal': p_vacation > 0.05}
+    for col in analysis['normality']:
+        p_value = _shapiro_p_value(data[col])
+        if not np.isnan(p_value):
+            analysis['normality'][col] = {'p_value': p_value, 'is_normal': p_value > 0.05}
 
     return analysis
 
 
+# Cleaned frame of a plot worker process, set once by _init_plot_worker
+_worker_data = None
+
+
+def _init_plot_worker(data):
+    """
+    ProcessPoolExecutor initializer: keep the cleaned frame for every plot this worker runs.
+    """
+    global _worker_data
+    _worker_data = data
+
+
+def _run_plot(plot, kwargs):
+    """
+    Run one plot function in a worker process on the frame set by _init_plot_worker.
+    """
+    plot(_worker_data, **kwargs)
+
+
 def main():
     try:
         file_path = "data13_big.csv"
         logging.info("Loading data...")
-        data = load_and_clean_data(file_path)
+        data = load_cached_data(file_path, chunksize=500_000)
 
         if data.empty:
             logging.error("No data available after cleaning. Check CSV file and data integrity.")
@@ -537,24 +930,29 @@ def main():
         analysis_results = analyze_data(data)
 
         logging.info("Generating visualizations...")
-        # Existing visualizations
-        plot_salary_vs_age(data)
-        plot_days_service_vs_vacation(data)
-        plot_salary_distribution(data)
-        plot_gender_salary_distribution(data)
-        plot_gender_performance_distribution(data)
-        plot_performance_distribution(data)
-        # New visualizations
-        plot_department_distribution(data)
-        plot_gender_distribution(data)
-        plot_education_distribution(data)
-        plot_city_distribution(data)
-        plot_state_distribution(data)
-        plot_employee_level_distribution(data)
-        plot_work_location_distribution(data)
-        plot_shift_distribution(data)
-        plot_status_distribution(data)
-        logging.info("All visualizations have been saved in the 'plotsBig' directory.")
+        # The plot functions expect the output directory to exist
+        output_dir = ensure_plot_directory("plotsBig")
+        normality = analysis_results['normality']
+        value_counts = _precompute_counts(data)
+        plot_jobs = [
+            (plot_salary_vs_age, {}),
+            (plot_days_service_vs_vacation, {}),
+            (plot_salary_distribution, {'shapiro_p': normality['base_salary']['p_value']}),
+            (plot_gender_salary_distribution, {}),
+            (plot_gender_performance_distribution, {}),
+            (plot_performance_distribution, {'shapiro_p': normality['performance_score']['p_value']}),
+        ] + [
+            (plot_distribution, {'column': col, 'counts': value_counts[col]}) for col in DISTRIBUTION_PLOTS
+        ]
+        # The plots are independent figures over read-only data, so render them in parallel processes.
+        # The frame goes to each worker once through the initializer, not with every task.
+        with ProcessPoolExecutor(max_workers=min(len(plot_jobs), os.cpu_count() or 1),
+                                 initializer=_init_plot_worker, initargs=(data,)) as executor:
+            futures = [executor.submit(_run_plot, plot, {'output_dir': output_dir, **kwargs})
+                       for plot, kwargs in plot_jobs]
+            for future in futures:
+                future.result()
+        logging.info(f"All visualizations have been saved in the '{output_dir}' directory.")
 
     except Exception as e:
         logging.error(f"Error in main: {e}")
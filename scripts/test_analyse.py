@@ -1,9 +1,16 @@
+import importlib.util
+import sys
+import tempfile
 import unittest
+import unittest.mock
+import warnings
 import pandas as pd
 import numpy as np
 import os
 from .analyse import (
+    clean_data,
     load_and_clean_data,
+    load_cached_data,
     plot_salary_vs_age,
     plot_days_service_vs_vacation,
     plot_salary_distribution,
@@ -20,117 +27,144 @@ from .analyse import (
     plot_shift_distribution,
     plot_status_distribution,
     analyze_data,
+    ensure_plot_directory,
+    _clean_chunk,
+    _load_and_clean_csv,
+    _read_csv_c,
+    _precompute_counts,
 )
 
+def write_csv(data, path):
+    """Write a DataFrame to CSV with Arrow's C++ writer when pyarrow is available."""
+    if importlib.util.find_spec("pyarrow"):
+        import pyarrow as pa
+        import pyarrow.csv as pv
+        pv.write_csv(pa.Table.from_pandas(data, preserve_index=False), path)
+    else:
+        data.to_csv(path, index=False)
+
+
+# Plot tests that re-render a chart kind already covered by a fast test only run on demand
+slow = unittest.skipUnless(os.environ.get("RUN_SLOW_TESTS"), "set RUN_SLOW_TESTS=1 to run the slow plot tests")
+
+
+# Plot function, output file and the column whose precomputed counts it takes.
+# PLOTS covers one chart kind each (scatter, histogram, bar, pie); SLOW_PLOTS the rest.
+PLOTS = [
+    (plot_salary_vs_age, "salary_vs_age.png", None),
+    (plot_salary_distribution, "salary_distribution.png", None),
+    (plot_department_distribution, "department_distribution.png", "department"),
+    (plot_gender_distribution, "gender_distribution.png", "gender"),
+]
+SLOW_PLOTS = [
+    (plot_days_service_vs_vacation, "days_service_vs_vacation.png", None),
+    (plot_gender_salary_distribution, "gender_salary_distribution.png", None),
+    (plot_gender_performance_distribution, "gender_performance_distribution.png", None),
+    (plot_performance_distribution, "performance_distribution.png", None),
+    (plot_education_distribution, "education_distribution.png", "education"),
+    (plot_city_distribution, "city_distribution.png", "city"),
+    (plot_state_distribution, "state_distribution.png", "state"),
+    (plot_employee_level_distribution, "employee_level_distribution.png", "employee_level"),
+    (plot_work_location_distribution, "work_location_distribution.png", "work_location"),
+    (plot_shift_distribution, "shift_distribution.png", "shift"),
+    (plot_status_distribution, "status_distribution.png", "status"),
+]
+
+
 class TestEmployeeDataAnalysis(unittest.TestCase):
-    def setUp(self):
-        # Sample data for testing
-        self.sample_data = pd.DataFrame(
-            {
-                "employee_id": ["EMP000000001", "EMP000000001", "EMP000000003"],  # Duplicate ID
-                "first_name": ["Justin", "William", "Brian"],
-                "last_name": ["Dodson", "Mendoza", "Garcia"],
-                "email": [
-                    "justin.dodson@company.com",
-                    "william.mendoza@company.com",
-                    "brian.garcia@company.com",
-                ],
-                "phone_number": [
-                    "+1-268-903-3140x814",
-                    "961-703-7758x823",
-                    "+1-923-424-9237x232",
-                ],
-                "department": ["Marketing", "Logistics", "Legal"],
-                "job_title": ["Content Strategist", "Logistics Manager", "Contract Specialist"],
-                "hire_date": ["2021-04-01", "2020-05-17", "2021-09-07"],
-                "days_service": [1491, 1810, 1332],
-                "base_salary": [43300.94, 48293.73, 114368.52],
-                "bonus_percentage": [2.71, 7.24, 6.61],
-                "status": ["Active", "Active", "Active"],
-                "birth_date": ["1974-07-08", "1980-05-30", "1971-08-21"],
-                "address": [
-                    "642 Albert Plaza",
-                    "654 Bethany Prairie Suite 186",
-                    "51257 Murray Crest Apt. 425",
-                ],
-                "city": ["Spokane", "New York", "Atlanta"],
-                "state": ["WA", "NY", "GA"],
-                "zip_code": ["83520", "20774", "34870"],
-                "country": ["USA", "USA", "USA"],
-                "gender": ["M", "M", "M"],
-                "education": ["High School", "Professional", "Master"],
-                "performance_score": [75.6, 68.62, 71.62],
-                "last_review_date": ["2021-12-26", "2021-08-15", "2023-11-28"],
-                "employee_level": ["Senior", "Senior", "Senior"],
-                "vacation_days": [19, 21, 22],
-                "sick_days": [6, 3, 7],
-                "work_location": ["Office", "Remote", "Office"],
-                "shift": ["Day", "Night", "Night"],
-                "emergency_contact": ["6089985520", "644-435-2090x3593", "+1-680-568-0610x0856"],
-                "ssn": ["694-96-8839", "741-91-7577", "645-22-0702"],
-                "bank_account": [
-                    "ISIH09445641824790",
-                    "ZWKL89652489774496",
-                    "ZLHA11113153048754",
-                ],
-            }
-        )
-        # Sample data with negative salary for testing error detection
-        self.sample_data_negative_salary = pd.DataFrame(
-            {
-                "employee_id": ["EMP000000001", "EMP000000002", "EMP000000003"],
-                "first_name": ["Justin", "William", "Brian"],
-                "last_name": ["Dodson", "Mendoza", "Garcia"],
-                "email": [
-                    "justin.dodson@company.com",
-                    "william.mendoza@company.com",
-                    "brian.garcia@company.com",
-                ],
-                "phone_number": [
-                    "+1-268-903-3140x814",
-                    "961-703-7758x823",
-                    "+1-923-424-9237x232",
-                ],
-                "department": ["Marketing", "Logistics", "Legal"],
-                "job_title": ["Content Strategist", "Logistics Manager", "Contract Specialist"],
-                "hire_date": ["2021-04-01", "2020-05-17", "2021-09-07"],
-                "days_service": [1491, 1810, 1332],
-                "base_salary": [43300.94, -5000.00, 114368.52],  # Negative salary
-                "bonus_percentage": [2.71, 7.24, 6.61],
-                "status": ["Active", "Active", "Active"],
-                "birth_date": ["1974-07-08", "1980-05-30", "1971-08-21"],
-                "address": [
-                    "642 Albert Plaza",
-                    "654 Bethany Prairie Suite 186",
-                    "51257 Murray Crest Apt. 425",
-                ],
-                "city": ["Spokane", "New York", "Atlanta"],
-                "state": ["WA", "NY", "GA"],
-                "zip_code": ["83520", "20774", "34870"],
-                "country": ["USA", "USA", "USA"],
-                "gender": ["M", "M", "M"],
-                "education": ["High School", "Professional", "Master"],
-                "performance_score": [75.6, 68.62, 71.62],
-                "last_review_date": ["2021-12-26", "2021-08-15", "2023-11-28"],
-                "employee_level": ["Senior", "Senior", "Senior"],
-                "vacation_days": [19, 21, 22],
-                "sick_days": [6, 3, 7],
-                "work_location": ["Office", "Remote", "Office"],
-                "shift": ["Day", "Night", "Night"],
-                "emergency_contact": ["6089985520", "644-435-2090x3593", "+1-680-568-0610x0856"],
-                "ssn": ["694-96-8839", "741-91-7577", "645-22-0702"],
-                "bank_account": [
-                    "ISIH09445641824790",
-                    "ZWKL89652489774496",
-                    "ZLHA11113153048754",
-                ],
-            }
+    # Sample data for testing, as typed arrays so the DataFrame adopts them without dtype inference
+    _FIXTURE_COLS = {
+        "employee_id": np.array(["EMP000000001", "EMP000000001", "EMP000000003"], dtype=object),  # Duplicate ID
+        "first_name": np.array(["Justin", "William", "Brian"], dtype=object),
+        "last_name": np.array(["Dodson", "Mendoza", "Garcia"], dtype=object),
+        "email": np.array([
+            "justin.dodson@company.com",
+            "william.mendoza@company.com",
+            "brian.garcia@company.com",
+        ], dtype=object),
+        "phone_number": np.array([
+            "+1-268-903-3140x814",
+            "961-703-7758x823",
+            "+1-923-424-9237x232",
+        ], dtype=object),
+        "department": np.array(["Marketing", "Logistics", "Legal"], dtype=object),
+        "job_title": np.array(["Content Strategist", "Logistics Manager", "Contract Specialist"], dtype=object),
+        "hire_date": np.array(["2021-04-01", "2020-05-17", "2021-09-07"], dtype=object),
+        "days_service": np.array([1491, 1810, 1332], dtype=np.int32),
+        "base_salary": np.array([43300.94, 48293.73, 114368.52], dtype=np.float64),
+        "bonus_percentage": np.array([2.71, 7.24, 6.61], dtype=np.float64),
+        "status": np.array(["Active", "Active", "Active"], dtype=object),
+        "birth_date": np.array(["1974-07-08", "1980-05-30", "1971-08-21"], dtype=object),
+        "address": np.array([
+            "642 Albert Plaza",
+            "654 Bethany Prairie Suite 186",
+            "51257 Murray Crest Apt. 425",
+        ], dtype=object),
+        "city": np.array(["Spokane", "New York", "Atlanta"], dtype=object),
+        "state": np.array(["WA", "NY", "GA"], dtype=object),
+        "zip_code": np.array(["83520", "20774", "34870"], dtype=object),
+        "country": np.array(["USA", "USA", "USA"], dtype=object),
+        "gender": np.array(["M", "M", "M"], dtype=object),
+        "education": np.array(["High School", "Professional", "Master"], dtype=object),
+        "performance_score": np.array([75.6, 68.62, 71.62], dtype=np.float64),
+        "last_review_date": np.array(["2021-12-26", "2021-08-15", "2023-11-28"], dtype=object),
+        "employee_level": np.array(["Senior", "Senior", "Senior"], dtype=object),
+        "vacation_days": np.array([19, 21, 22], dtype=np.int16),
+        "sick_days": np.array([6, 3, 7], dtype=np.int16),
+        "work_location": np.array(["Office", "Remote", "Office"], dtype=object),
+        "shift": np.array(["Day", "Night", "Night"], dtype=object),
+        "emergency_contact": np.array(["6089985520", "644-435-2090x3593", "+1-680-568-0610x0856"], dtype=object),
+        "ssn": np.array(["694-96-8839", "741-91-7577", "645-22-0702"], dtype=object),
+        "bank_account": np.array([
+            "ISIH09445641824790",
+            "ZWKL89652489774496",
+            "ZLHA11113153048754",
+        ], dtype=object),
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sample_data = pd.DataFrame(cls._FIXTURE_COLS, copy=False)
+        # Sample data with negative salary for testing error detection; identical to sample_data
+        # except for the second row's salary and (now unique) ID
+        cls.sample_data_negative_salary = cls.sample_data.copy()
+        cls.sample_data_negative_salary.at[1, "base_salary"] = -5000.00
+        cls.sample_data_negative_salary.at[1, "employee_id"] = "EMP000000002"
+        # Everything the tests write goes under a private temporary directory, removed in one
+        # rmtree when the class finishes (also if setUpClass fails part way)
+        temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls._tmpdir = temp_dir.name
+        # Save sample data to a temporary CSV file for the tests of the CSV path
+        cls.temp_file = os.path.join(cls._tmpdir, "sample.csv")
+        write_csv(cls.sample_data, cls.temp_file)
+        cls.cache_dir = os.path.join(cls._tmpdir, "cache")
+        cls.plot_dir = os.path.join(cls._tmpdir, "plotsBig")
+        ensure_plot_directory(cls.plot_dir)
+        # The tests only check that the images exist, so save them small and barely compressed
+        savefig_kwargs = unittest.mock.patch.dict(
+            f"{__package__}.analyse.SAVEFIG_KWARGS", {"dpi": 72, "pil_kwargs": {"compress_level": 1}}
         )
-        # Save sample data to temporary CSV files
-        self.temp_file = "temp_sample_data.csv"
-        self.sample_data.to_csv(self.temp_file, index=False)
-        self.temp_file_negative_salary = "temp_sample_data_negative_salary.csv"
-        self.sample_data_negative_salary.to_csv(self.temp_file_negative_salary, index=False)
+        savefig_kwargs.start()
+        cls.addClassCleanup(savefig_kwargs.stop)
+        # Clean the samples in memory once; the plot and analysis tests only read them
+        cls.df = clean_data(cls.sample_data)
+        cls.df_negative_salary = clean_data(cls.sample_data_negative_salary)
+        # Value counts shared by the distribution plot tests
+        cls.counts = _precompute_counts(cls.df)
+
+    def setUp(self):
+        # Loads are memoized per file, whichever reader ran; start every test with an empty cache
+        _load_and_clean_csv.cache_clear()
+
+    def _load_with_c_parser(self, file_path, chunksize=None):
+        # Load without pyarrow, bypassing results the Arrow reader left in the memo
+        _load_and_clean_csv.cache_clear()
+        with unittest.mock.patch(f"{__package__}.analyse.pa", None), \
+                unittest.mock.patch(f"{__package__}.analyse._read_csv_c", wraps=_read_csv_c) as read:
+            df = load_and_clean_data(file_path, chunksize=chunksize)
+        read.assert_called()
+        return df
 
     def test_load_and_clean_data(self):
         # Test with the temporary file (normal data)
@@ -144,9 +178,19 @@ class TestEmployeeDataAnalysis(unittest.TestCase):
         self.assertTrue(all(df["hire_date"] <= pd.Timestamp("2025-05-01")))
         self.assertTrue(all(df["last_review_date"] <= pd.Timestamp("2025-05-01")))
         self.assertIn("age", df.columns)
+        # Ages on 2025-05-01, rounded to whole years
+        self.assertEqual(df["age"].tolist(), [51, 45, 54])
+        for col in ["department", "gender", "education", "employee_level", "work_location", "shift", "status"]:
+            self.assertIsInstance(df[col].dtype, pd.CategoricalDtype)
+        for col in ["birth_date", "hire_date", "last_review_date"]:
+            self.assertTrue(pd.api.types.is_datetime64_any_dtype(df[col]))
+        self.assertEqual(df["base_salary"].dtype, np.float32)
+        self.assertEqual(df["vacation_days"].dtype, pd.Int8Dtype())
+        # Cleaning the same rows in memory gives the same frame
+        pd.testing.assert_frame_equal(df, self.df)
 
         # Test with negative salary data
-        df = load_and_clean_data(self.temp_file_negative_salary)
+        df = self.df_negative_salary
         self.assertEqual(len(df), 2)  # Should remove the row with negative salary
         self.assertTrue(all(df["base_salary"] >= 0))
 
@@ -155,99 +199,183 @@ class TestEmployeeDataAnalysis(unittest.TestCase):
             df = load_and_clean_data("scripts/employee_data.csv")
             self.assertFalse(df.empty)
 
-    def test_plot_salary_vs_age(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_salary_vs_age(df)
-        self.assertTrue(os.path.exists("plotsBig/salary_vs_age.png"))
-        os.remove("plotsBig/salary_vs_age.png")
+    def test_load_and_clean_data_in_chunks(self):
+        # Cleaning block by block gives the same frame as cleaning the whole file at once
+        file_path = os.path.join(os.path.dirname(__file__), "employee_data.csv")
+        df = load_and_clean_data(file_path)
+        chunked = load_and_clean_data(file_path, chunksize=300)
+        pd.testing.assert_frame_equal(df, chunked)
+        # Same blocks through the C parser (without pyarrow, Arrow streams them otherwise)
+        pd.testing.assert_frame_equal(df, self._load_with_c_parser(file_path, chunksize=300))
 
-    def test_plot_days_service_vs_vacation(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_days_service_vs_vacation(df)
-        self.assertTrue(os.path.exists("plotsBig/days_service_vs_vacation.png"))
-        os.remove("plotsBig/days_service_vs_vacation.png")
+    def test_load_and_clean_data_in_chunks_with_empty_block(self):
+        # A block where a categorical column is entirely missing still merges with the others
+        data = pd.read_csv(os.path.join(os.path.dirname(__file__), "employee_data.csv"), dtype=str)
+        data.loc[:299, ["city", "status"]] = None
+        temp_file = os.path.join(self._tmpdir, "sample_empty_block.csv")
+        write_csv(data, temp_file)
+        df = load_and_clean_data(temp_file)
+        # Without falling back to pd.concat's object columns (a FutureWarning on pandas 2)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", FutureWarning)
+            pd.testing.assert_frame_equal(df, load_and_clean_data(temp_file, chunksize=300))
+            pd.testing.assert_frame_equal(df, self._load_with_c_parser(temp_file, chunksize=300))
+        self.assertEqual(df["city"].isna().sum(), 300)
 
-    def test_plot_salary_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_salary_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/salary_distribution.png"))
-        os.remove("plotsBig/salary_distribution.png")
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is required for the Arrow CSV reader")
+    def test_load_and_clean_data_arrow_fallback(self):
+        # An unparseable date makes the Arrow reader fail; the C parser then coerces it to NaT
+        data = pd.read_csv(os.path.join(os.path.dirname(__file__), "employee_data.csv"), dtype=str)
+        data.loc[0, "hire_date"] = "not a date"
+        temp_file = os.path.join(self._tmpdir, "sample_bad_date.csv")
+        write_csv(data, temp_file)
+        with self.assertLogs(level="WARNING") as logs:
+            df = load_and_clean_data(temp_file)
+        self.assertTrue(any("falling back to the C parser" in message for message in logs.output))
+        self.assertEqual(len(df), len(data) - 1)
 
-    def test_plot_gender_salary_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_gender_salary_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/gender_salary_distribution.png"))
-        os.remove("plotsBig/gender_salary_distribution.png")
+    def test_load_and_clean_data_memoized(self):
+        temp_file = os.path.join(self._tmpdir, "sample_memoized.csv")
+        write_csv(self.sample_data, temp_file)
+        df = load_and_clean_data(temp_file)
 
-    def test_plot_gender_performance_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_gender_performance_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/gender_performance_distribution.png"))
-        os.remove("plotsBig/gender_performance_distribution.png")
+        # An unchanged file is served from the cache, as a separate frame
+        with unittest.mock.patch(f"{__package__}.analyse._clean_chunk") as clean:
+            cached = load_and_clean_data(temp_file)
+        clean.assert_not_called()
+        self.assertIsNot(cached, df)
+        pd.testing.assert_frame_equal(df, cached)
 
-    def test_plot_performance_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_performance_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/performance_distribution.png"))
-        os.remove("plotsBig/performance_distribution.png")
+        # Changing a returned frame leaves the cached result intact
+        cached.loc[0, "base_salary"] = -1.0
+        pd.testing.assert_frame_equal(df, load_and_clean_data(temp_file))
 
-    def test_plot_department_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_department_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/department_distribution.png"))
-        os.remove("plotsBig/department_distribution.png")
+        # A newer modification time invalidates the entry
+        stat = os.stat(temp_file)
+        os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with unittest.mock.patch(f"{__package__}.analyse._clean_chunk", wraps=_clean_chunk) as clean:
+            load_and_clean_data(temp_file)
+        clean.assert_called_once()
 
-    def test_plot_gender_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_gender_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/gender_distribution.png"))
-        os.remove("plotsBig/gender_distribution.png")
+    def test_non_numeric_values_coerced(self):
+        # A value that is not a number drops or blanks its row instead of failing the load
+        data = pd.read_csv(os.path.join(os.path.dirname(__file__), "employee_data.csv"), dtype=str)
+        data.loc[0, "base_salary"] = "abc"
+        data.loc[1, "days_service"] = "12.5"
+        data.loc[2, "vacation_days"] = "x"
+        temp_file = os.path.join(self._tmpdir, "sample_non_numeric.csv")
+        write_csv(data, temp_file)
+        with self.assertLogs(level="WARNING") as logs:
+            df = load_and_clean_data(temp_file)
+        self.assertTrue(any("Non-numeric values found" in message for message in logs.output))
+        self.assertEqual(len(df), len(data) - 1)
+        self.assertNotIn(data.loc[0, "employee_id"], set(df["employee_id"]))
+        self.assertTrue(pd.isna(df.loc[df["employee_id"] == data.loc[1, "employee_id"], "days_service"]).all())
+        self.assertTrue(pd.isna(df.loc[df["employee_id"] == data.loc[2, "employee_id"], "vacation_days"]).all())
+        pd.testing.assert_frame_equal(df, load_and_clean_data(temp_file, chunksize=300))
+        pd.testing.assert_frame_equal(df, clean_data(data))
 
-    def test_plot_education_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_education_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/education_distribution.png"))
-        os.remove("plotsBig/education_distribution.png")
+        # Same through the C parser, and for the small in-memory sample
+        pd.testing.assert_frame_equal(df, self._load_with_c_parser(temp_file, chunksize=300))
+        sample = self.sample_data.copy()
+        sample["base_salary"] = sample["base_salary"].astype(object)
+        sample.at[2, "base_salary"] = "abc"
+        self.assertEqual(clean_data(sample)["employee_id"].tolist(), ["EMP000000001", "EMP000000001"])
 
-    def test_plot_city_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_city_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/city_distribution.png"))
-        os.remove("plotsBig/city_distribution.png")
+    def test_missing_numeric_values_reported(self):
+        data = self.sample_data.copy()
+        data.at[0, "base_salary"] = np.nan
+        data.at[2, "performance_score"] = np.nan
+        with self.assertLogs(level="WARNING") as logs:
+            df = clean_data(data)
+        self.assertTrue(any("Found 2 rows missing base_salary or performance_score" in message
+                            for message in logs.output))
+        self.assertEqual(len(df), 1)
 
-    def test_plot_state_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_state_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/state_distribution.png"))
-        os.remove("plotsBig/state_distribution.png")
+    def test_category_labels_stripped(self):
+        data = self.sample_data.copy()
+        data["department"] = [" Marketing", "Marketing ", "Legal"]
+        df = clean_data(data)
+        self.assertEqual(df["department"].tolist(), ["Marketing", "Marketing", "Legal"])
+        self.assertEqual(list(df["department"].cat.categories), ["Legal", "Marketing"])
 
-    def test_plot_employee_level_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_employee_level_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/employee_level_distribution.png"))
-        os.remove("plotsBig/employee_level_distribution.png")
+        # Non-string labels are kept as they are
+        data["shift"] = [1, 2, 2]
+        df = clean_data(data)
+        self.assertEqual(df["shift"].tolist(), [1, 2, 2])
 
-    def test_plot_work_location_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_work_location_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/work_location_distribution.png"))
-        os.remove("plotsBig/work_location_distribution.png")
+    def test_future_dates_removed(self):
+        data = self.sample_data.copy()
+        data["hire_date"] = ["2021-04-01", "2026-01-10", "2021-09-07"]
+        data["last_review_date"] = ["2021-12-26", "2021-08-15", "2025-12-01"]
+        df = clean_data(data)
+        self.assertEqual(df["employee_id"].tolist(), ["EMP000000001"])
 
-    def test_plot_shift_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_shift_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/shift_distribution.png"))
-        os.remove("plotsBig/shift_distribution.png")
+    def test_invalid_employee_ids_detected(self):
+        # IDs must be exactly EMP followed by 9 digits; longer IDs are flagged too
+        data = self.sample_data.copy()
+        data["employee_id"] = ["EMP000000001", "EMP000000000002", "X00000003"]
+        with self.assertLogs(level="WARNING") as logs:
+            clean_data(data)
+        self.assertTrue(any("Found 2 invalid employee IDs" in message for message in logs.output))
 
-    def test_plot_status_distribution(self):
-        df = load_and_clean_data(self.temp_file)
-        plot_status_distribution(df)
-        self.assertTrue(os.path.exists("plotsBig/status_distribution.png"))
-        os.remove("plotsBig/status_distribution.png")
+    def test_checks_reported_once_per_load(self):
+        # Every employee_id in the sample file has 12 digits; blocks report their counts,
+        # which are logged once for the whole file
+        file_path = os.path.join(os.path.dirname(__file__), "employee_data.csv")
+        with self.assertLogs(level="INFO") as logs:
+            load_and_clean_data(file_path, chunksize=300)
+        invalid_ids = [message for message in logs.output if "invalid employee IDs" in message]
+        self.assertEqual(len(invalid_ids), 1)
+        self.assertIn("Found 1000 invalid employee IDs", invalid_ids[0])
+        self.assertEqual(sum("Missing values" in message for message in logs.output), 1)
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is required for the Parquet cache")
+    def test_load_cached_data(self):
+        df = load_cached_data(self.temp_file, cache_dir=self.cache_dir)
+        # The Parquet file is the cache; the cleaned frame is not also kept in memory
+        self.assertEqual(_load_and_clean_csv.cache_info().currsize, 0)
+        cached_files = [name for name in os.listdir(self.cache_dir) if name.endswith(".parquet")]
+        self.assertEqual(len(cached_files), 1)
+        self.assertTrue(cached_files[0].startswith("sample-"))
+
+        # A fresh cache is read back instead of parsing the CSV again
+        with unittest.mock.patch(f"{__package__}.analyse.load_and_clean_data") as load:
+            cached = load_cached_data(self.temp_file, cache_dir=self.cache_dir)
+        load.assert_not_called()
+        pd.testing.assert_frame_equal(df, cached)
+
+        # A CSV with the same name in another directory gets its own entry
+        other_dir = os.path.join(self._tmpdir, "other")
+        os.makedirs(other_dir)
+        other_file = os.path.join(other_dir, "sample.csv")
+        write_csv(self.sample_data_negative_salary, other_file)
+        other = load_cached_data(other_file, cache_dir=self.cache_dir)
+        pd.testing.assert_frame_equal(other, self.df_negative_salary)
+
+        # Changing the CSV invalidates its entry
+        stat = os.stat(other_file)
+        os.utime(other_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with unittest.mock.patch(f"{__package__}.analyse.load_and_clean_data", return_value=other) as load:
+            load_cached_data(other_file, cache_dir=self.cache_dir)
+        load.assert_called_once()
+
+    def _check_plots(self, plots):
+        for plot, filename, counts_column in plots:
+            with self.subTest(plot=plot.__name__):
+                kwargs = {"counts": self.counts[counts_column]} if counts_column else {}
+                plot(self.df, output_dir=self.plot_dir, **kwargs)
+                self.assertTrue(os.path.exists(os.path.join(self.plot_dir, filename)))
+
+    def test_plots(self):
+        self._check_plots(PLOTS)
+
+    @slow
+    def test_slow_plots(self):
+        self._check_plots(SLOW_PLOTS)
 
     def test_analyze_data(self):
-        df = load_and_clean_data(self.temp_file)
-        analysis = analyze_data(df)
+        analysis = analyze_data(self.df)
         self.assertIn("salary_stats", analysis)
         self.assertIn("performance_stats", analysis)
         self.assertIn("vacation_days_stats", analysis)
@@ -255,18 +383,15 @@ class TestEmployeeDataAnalysis(unittest.TestCase):
         self.assertFalse(analysis["normality"]["base_salary"]["is_normal"])
         self.assertFalse(analysis["normality"]["performance_score"]["is_normal"])
         self.assertFalse(analysis["normality"]["vacation_days"]["is_normal"])
+        # Three rows are far too few for Shapiro-Wilk, so no test is run
+        self.assertTrue(np.isnan(analysis["normality"]["base_salary"]["p_value"]))
 
-    def tearDown(self):
-        # Clean up the temporary CSV files
-        if os.path.exists(self.temp_file):
-            os.remove(self.temp_file)
-        if os.path.exists(self.temp_file_negative_salary):
-            os.remove(self.temp_file_negative_salary)
-        # Clean up the plotsBig directory if it exists
-        if os.path.exists("plotsBig"):
-            for file in os.listdir("plotsBig"):
-                os.remove(os.path.join("plotsBig", file))
-            os.rmdir("plotsBig")
+    @classmethod
+    def tearDownClass(cls):
+        # Release the figure shared by the plot functions (pyplot is only loaded if a plot test ran)
+        plt = sys.modules.get("matplotlib.pyplot")
+        if plt is not None:
+            plt.close("all")
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file